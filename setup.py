@@ -6,9 +6,16 @@ setup(
     packages=find_packages(),
     install_requires=[
         'requests',
+        'urllib3>=1.26',
         'pandas',
         'boto3',
     ],
+    extras_require={
+        'async': ['httpx[http2]'],
+        'speedups': ['orjson', 'ijson>=3.1'],
+        'compression': ['brotli', 'zstandard'],
+        'arrow': ['pyarrow', 'pandas>=1.5'],
+    },
     author='xtech',
     author_email='support@exponential-tech.ai',
     description='A Python package to interact with the Unifier API.',
@@ -20,6 +27,6 @@ setup(
         'License :: OSI Approved :: GNU General Public License v3 (GPLv3)',
         'Operating System :: OS Independent',
     ],
-    python_requires='>=3.6',
+    python_requires='>=3.7',
     license='GPL-3.0',
 )
@@ -1,13 +1,30 @@
+import asyncio
+import atexit
+import json
 import logging
 import os
+import queue
+import re
+import secrets
+import socket
 import subprocess
 import shutil
-from typing import Any, Dict, List, Optional, Sequence
+import threading
+import time
+from collections import OrderedDict
+from contextlib import closing
+from operator import itemgetter
+from typing import (
+    TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Union,
+)
 import fnmatch
 from concurrent.futures import ThreadPoolExecutor
 
 import requests
-import pandas as pd
+import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 try:
     import boto3
     from botocore.client import Config
@@ -15,9 +32,629 @@ try:
 except ImportError:
     boto3 = None
     TransferConfig = None
+try:
+    import httpx
+except ImportError:
+    httpx = None
+try:
+    # httpx only needs h2 once an HTTP/2 client is created, so check up front.
+    import h2
+except ImportError:
+    h2 = None
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import ijson
+except ImportError:
+    ijson = None
+_IJSON_ERRORS = (ijson.JSONError,) if ijson is not None else ()
+
+if TYPE_CHECKING:
+    # pandas is imported lazily by the DataFrame helpers so `query`, `get_json`
+    # and `replicate` don't pay its import time.
+    import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+
+# Resolved once at import; `replicate` checks these instead of searching PATH.
+_RCLONE_PATH = shutil.which("rclone")
+_S5CMD_PATH = shutil.which("s5cmd")
+
+_JSON_CONTENT_TYPE = {"Content-Type": "application/json"}
+
+
+def _accept_encoding() -> str:
+    """Return the response encodings to advertise, best compression first.
+
+    Only codings urllib3 can decode here are listed: `br` and `zstd` need the
+    optional `brotli` / `zstandard` packages.
+    """
+    supported = ACCEPT_ENCODING.split(",")
+    return ", ".join(e for e in ("zstd", "br", "gzip") if e in supported)
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize a request payload, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _loads(data: bytes) -> Any:
+    """Parse a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class _TTLCache:
+    """Small thread-safe LRU cache whose entries expire after a TTL.
+
+    Besides the entry count, the total `weight` of the entries can be
+    bounded with `maxweight`; values heavier than that are not cached.
+    """
+
+    def __init__(self, maxsize: int = 128, maxweight: Optional[int] = None) -> None:
+        self.maxsize = maxsize
+        self.maxweight = maxweight
+        self._data: "OrderedDict[Any, Any]" = OrderedDict()
+        self._weight = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Any, ttl: float) -> Any:
+        """Return the cached value for `key`, or None if missing or older than `ttl`."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            stamp, value, weight = entry
+            if time.monotonic() - stamp > ttl:
+                del self._data[key]
+                self._weight -= weight
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Any, value: Any, weight: int = 1) -> None:
+        if self.maxweight is not None and weight > self.maxweight:
+            return
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self._weight -= old[2]
+            self._data[key] = (time.monotonic(), value, weight)
+            self._weight += weight
+            while len(self._data) > self.maxsize or (
+                self.maxweight is not None and self._weight > self.maxweight
+            ):
+                self._weight -= self._data.popitem(last=False)[1][2]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._weight = 0
+
+
+_asof_dates_cache = _TTLCache(maxsize=128)
+# Weighted by cell count, so large query results cannot pin gigabytes.
+_query_cache = _TTLCache(maxsize=128, maxweight=1_000_000)
+
+
+def _prefetch(iterable: Iterable[Any], depth: int = 4) -> Iterator[Any]:
+    """Iterate `iterable` on a background thread, keeping `depth` items ready.
+
+    Used to overlap slow paginated listings with the work done per page.
+    Exceptions raised by `iterable` are re-raised in the consumer; closing
+    the generator early stops the producer.
+    """
+    items: "queue.Queue[Any]" = queue.Queue(maxsize=depth)
+    done = object()
+    stop = threading.Event()
+
+    def _put(entry: Any) -> bool:
+        while not stop.is_set():
+            try:
+                items.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _produce() -> None:
+        try:
+            for item in iterable:
+                if not _put((item, None)):
+                    return
+        except BaseException as e:
+            _put((done, e))
+        else:
+            _put((done, None))
+
+    threading.Thread(target=_produce, daemon=True).start()
+    try:
+        while True:
+            item, error = items.get()
+            if item is done:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        stop.set()
+
+
+def _compile_globs(patterns: Sequence[str]) -> Optional["re.Pattern"]:
+    """Compile fnmatch-style `patterns` into one regex, or None if empty.
+
+    Matching a key is then a single regex call instead of one `fnmatch`
+    call per pattern. Case sensitivity follows `fnmatch.fnmatch`.
+    """
+    if not patterns:
+        return None
+    flags = re.IGNORECASE if os.path.normcase("A") != "A" else 0
+    return re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in patterns), flags)
+
+
+def _rclone_include_patterns(folders: Sequence[str]) -> List[str]:
+    """Translate server-provided folder globs into rclone include rules."""
+    patterns = []
+    for folder in folders:
+        if folder.startswith("/"):
+            folder = folder.lstrip("/")
+        if folder.endswith("*"):
+            folder = folder[:-1] + "**"
+        patterns.append(folder)
+    return patterns
+
+
+def _run_streaming(cmd: List[str], env: Dict[str, str]) -> None:
+    """Run `cmd`, forwarding each line of its output as it is printed.
+
+    Lines are logged and printed, so callers can capture progress through
+    `logging`. If the caller is interrupted (Ctrl-C, or an error while
+    printing), the process is terminated. Raises
+    `subprocess.CalledProcessError` on a non-zero exit status.
+    """
+    proc = subprocess.Popen(
+        cmd,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        bufsize=1,
+        universal_newlines=True,
+        errors="replace",
+    )
+    try:
+        with proc.stdout:
+            for line in proc.stdout:
+                line = line.rstrip()
+                logger.info(line)
+                print(line)
+        returncode = proc.wait()
+    except BaseException:
+        proc.terminate()
+        try:
+            proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+        raise
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, cmd)
+
+
+class _RcloneDaemon:
+    """A background `rclone rcd` process driven over its remote-control API.
+
+    One daemon per interpreter lets back-to-back `replicate` calls skip
+    rclone's start-up and reuse its warm S3 connection pool. Credentials
+    are passed per job in an on-the-fly remote, so they are never written
+    to a config file, and the API is protected by a random password passed
+    through the environment.
+    """
+
+    def __init__(self, rclone_path: str, start_timeout: float = 10.0) -> None:
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}/"
+        self._auth = ("unifier", secrets.token_urlsafe(24))
+        # The Unifier session's retry policy would slow down readiness polling;
+        # the daemon is local, so a plain session is enough.
+        self._session = requests.Session()
+
+        env = os.environ.copy()
+        env["RCLONE_RC_USER"], env["RCLONE_RC_PASS"] = self._auth
+        self._proc = subprocess.Popen(
+            [rclone_path, "rcd", f"--rc-addr=127.0.0.1:{port}", "--config", "/dev/null"],
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        atexit.register(self.close)
+
+        deadline = time.monotonic() + start_timeout
+        try:
+            while True:
+                if self._proc.poll() is not None:
+                    raise RuntimeError(f"rclone rcd exited with code {self._proc.returncode}")
+                try:
+                    self.call("rc/noop")
+                    return
+                except requests.exceptions.ConnectionError:
+                    if time.monotonic() > deadline:
+                        raise RuntimeError("rclone rcd did not start in time")
+                    time.sleep(0.1)
+        except BaseException:
+            # Whatever went wrong (rc errors, timeouts, Ctrl-C), do not leave
+            # the process running.
+            self.close()
+            atexit.unregister(self.close)
+            raise
+
+    def alive(self) -> bool:
+        return self._proc.poll() is None
+
+    def close(self) -> None:
+        """Stop the daemon."""
+        if self._proc.poll() is None:
+            self._proc.terminate()
+            try:
+                self._proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self._proc.kill()
+
+    def call(self, command: str, **params: Any) -> Dict[str, Any]:
+        """Invoke an rc `command` and return its JSON reply."""
+        response = self._session.post(
+            self.url + command,
+            headers=_JSON_CONTENT_TYPE,
+            data=_dumps(params),
+            auth=self._auth,
+            timeout=30,
+        )
+        try:
+            body = _loads(response.content)
+        except ValueError:
+            body = {}
+        if response.status_code != 200:
+            raise RuntimeError(
+                f"rclone rc {command} failed: {body.get('error', response.status_code)}"
+            )
+        return body
+
+    @staticmethod
+    def _s3_remote(parameters: Dict[str, str]) -> str:
+        """Return an on-the-fly `:s3,...:` remote for these S3 settings.
+
+        Values are double-quoted (inner quotes doubled) so endpoints and
+        secrets may contain `:` or `,`.
+        """
+        options = ",".join(
+            '{}="{}"'.format(k, str(v).replace('"', '""')) for k, v in parameters.items()
+        )
+        return f":s3,{options}:"
+
+    def copy(
+        self,
+        parameters: Dict[str, str],
+        data_path: str,
+        target_location: str,
+        include: Sequence[str],
+        transfers: int,
+        checkers: int,
+        bandwidth_limit: Optional[int] = None,
+    ) -> None:
+        """Copy `data_path` from S3 into `target_location` and wait for it.
+
+        Raises RuntimeError if the copy job fails. Ctrl-C stops the job.
+        """
+        params: Dict[str, Any] = {
+            "srcFs": self._s3_remote(parameters) + data_path,
+            "dstFs": os.path.abspath(target_location),
+            "_async": True,
+            "_config": {
+                "Transfers": transfers,
+                "Checkers": checkers,
+                "UseListR": True,
+                "UseMmap": True,
+            },
+        }
+        if include:
+            params["_filter"] = {"IncludeRule": list(include)}
+
+        if bandwidth_limit:
+            # rclone's bandwidth limit is global to the daemon.
+            self.call("core/bwlimit", rate=f"{bandwidth_limit}M")
+        try:
+            jobid = self.call("sync/copy", **params)["jobid"]
+            self._wait(jobid)
+        finally:
+            if bandwidth_limit:
+                self.call("core/bwlimit", rate="off")
+
+    def _wait(self, jobid: int, report_every: float = 10.0) -> None:
+        last_report = time.monotonic()
+        try:
+            while True:
+                status = self.call("job/status", jobid=jobid)
+                if status.get("finished"):
+                    break
+                if time.monotonic() - last_report >= report_every:
+                    stats = self.call("core/stats", group=f"job/{jobid}")
+                    print(
+                        f"Transferred {stats.get('transfers', 0)} files, "
+                        f"{stats.get('bytes', 0) / 1e6:.1f} MB..."
+                    )
+                    last_report = time.monotonic()
+                time.sleep(1)
+        except KeyboardInterrupt:
+            self.call("job/stop", jobid=jobid)
+            raise
+        if not status.get("success"):
+            raise RuntimeError(f"rclone copy failed: {status.get('error')}")
+
+
+_rclone_daemon_lock = threading.Lock()
+_session_lock = threading.Lock()
+
+
+def _as_list(items: Iterable[Any]) -> List[Any]:
+    """Return `items` as a list, without copying one that already is.
+
+    NumPy arrays and pandas Series/Index are converted with `tolist()`, which
+    yields plain Python scalars the JSON encoders can serialize natively.
+    """
+    if isinstance(items, list):
+        return items
+    tolist = getattr(items, "tolist", None)
+    if tolist is not None:
+        return tolist()
+    return list(items)
+
+
+def _chunked(items: Sequence[Any], size: int) -> List[List[Any]]:
+    """Split `items` into consecutive lists of at most `size` elements."""
+    if size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    items = _as_list(items)
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def _select_columns(
+    data: Dict[str, List[Any]], columns: Optional[Sequence[str]]
+) -> Dict[str, List[Any]]:
+    """Keep only `columns` (in that order) from a columnar result, if given."""
+    if columns is None:
+        return data
+    return {k: data[k] for k in columns if k in data}
+
+
+# Column value types -> the NumPy dtype pandas would infer for them. None is
+# only allowed alongside numbers, where pandas turns it into NaN.
+_NUMPY_DTYPES = {
+    frozenset([int]): "int64",
+    frozenset([float]): "float64",
+    frozenset([bool]): "bool",
+    frozenset([int, float]): "float64",
+    frozenset([int, type(None)]): "float64",
+    frozenset([float, type(None)]): "float64",
+    frozenset([int, float, type(None)]): "float64",
+}
+_NUMPY_CANDIDATES = (int, float, bool, type(None))
+
+
+def _to_numpy_column(col: List[Any]) -> Any:
+    """Convert a homogeneous numeric/bool column to a NumPy array.
+
+    Building the array in one call skips pandas' per-element object
+    inference. Any other column (strings, dates, mixed types, or one that is
+    already an array) is returned unchanged for pandas to handle.
+    """
+    import numpy as np
+
+    if not isinstance(col, list) or not col or type(col[0]) not in _NUMPY_CANDIDATES:
+        return col
+    dtype = _NUMPY_DTYPES.get(frozenset(map(type, col)))
+    if dtype is None:
+        return col
+    try:
+        return np.array(col, dtype=dtype)
+    except (OverflowError, TypeError, ValueError):
+        return col
+
+
+def _apply_schema(data: Dict[str, List[Any]], schema: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert the columns named in `schema` to their given dtypes.
+
+    Datetime dtypes are parsed with `pd.to_datetime`; other dtypes build a
+    NumPy array directly, so pandas does not have to infer them. Columns
+    not in `schema` are left as they are.
+    """
+    import numpy as np
+    import pandas as pd
+
+    typed: Dict[str, Any] = dict(data)
+    for k, dtype in schema.items():
+        if k not in typed:
+            continue
+        if pd.api.types.is_datetime64_any_dtype(dtype):
+            typed[k] = pd.to_datetime(typed[k], cache=True).astype(dtype)
+        else:
+            typed[k] = np.asarray(typed[k], dtype=dtype)
+    return typed
+
+
+def _to_dataframe(data: Dict[str, List[Any]], backend: str = "numpy") -> "pd.DataFrame":
+    """Build a DataFrame from a columnar result.
+
+    `backend` is "numpy" (pandas defaults) or "pyarrow" (`pd.ArrowDtype`
+    columns). Falls back to "numpy" if pyarrow is missing or cannot type a
+    column.
+    """
+    import pandas as pd
+
+    if backend not in ("numpy", "pyarrow"):
+        raise ValueError(f"Unknown DataFrame backend: {backend!r}")
+    if not data:
+        return pd.DataFrame()
+    if backend == "pyarrow":
+        try:
+            import pyarrow as pa
+        except ImportError:
+            logger.warning("pyarrow is not installed; using the numpy backend.")
+            logger.info("Please install pyarrow: pip install pyarrow")
+        else:
+            try:
+                table = pa.Table.from_pydict(data)
+            except pa.ArrowException as e:
+                logger.warning("Could not build Arrow table (%s); using the numpy backend.", e)
+            else:
+                # self_destruct releases Arrow buffers as pandas takes them over.
+                return table.to_pandas(types_mapper=pd.ArrowDtype, self_destruct=True)
+    return pd.DataFrame({k: _to_numpy_column(v) for k, v in data.items()}, copy=False)
+
+
+class _ReplayStream:
+    """File-like reader that returns `head` before the rest of `raw`.
+
+    Lets the start of a streamed body be inspected without losing it for
+    the parser that reads the stream afterwards.
+    """
+
+    def __init__(self, head: bytes, raw: Any) -> None:
+        self._head = head
+        self._raw = raw
+
+    def read(self, size: int = -1) -> bytes:
+        if not self._head:
+            return self._raw.read(size)
+        if size is None or size < 0:
+            data, self._head = self._head + self._raw.read(), b""
+        else:
+            data, self._head = self._head[:size], self._head[size:]
+        return data
+
+
+def _read_json_head(raw: Any, chunk_size: int = 8192) -> bytes:
+    """Read from `raw` until its first non-whitespace byte, or EOF."""
+    head = b""
+    while True:
+        chunk = raw.read(chunk_size)
+        head += chunk
+        if not chunk or head.lstrip():
+            return head
+
+
+def _rows_from_body(content: bytes, what: str = "query") -> List[Any]:
+    """Parse a 200 response body that should hold a list of rows.
+
+    Returns an empty list (after logging) if the body is not JSON or not
+    a list.
+    """
+    try:
+        response_data = _loads(content)
+    except ValueError as e:
+        logger.error("Unifier %s response could not be parsed: %s", what, e)
+        return []
+    if not isinstance(response_data, list):
+        logger.warning("Unexpected %s response format: %r", what, type(response_data))
+        return []
+    return response_data
+
+
+def _error_from_response(response: Any) -> Optional[str]:
+    """Return the server-provided `error` message of a response, if any."""
+    try:
+        body = _loads(response.content)
+    except ValueError:
+        return None
+    if isinstance(body, dict) and "error" in body:
+        return body["error"]
+    return None
+
+
+def _flatten_stream(
+    rows: Iterable[Sequence[Dict[str, Any]]]
+) -> Iterator[Dict[str, Any]]:
+    """Lazily yield one merged dict per response row.
+
+    This is the hottest loop of the module, so `dict.update` is bound to a
+    local and applied inline rather than through a per-row helper call.
+    """
+    update = dict.update
+    for item in rows:
+        row: Dict[str, Any] = {}
+        for d in item:
+            update(row, d)
+        yield row
+
+
+def _columns_from_layout(
+    rows: List[Sequence[Dict[str, Any]]]
+) -> Optional[Dict[str, List[Any]]]:
+    """Transpose rows that share the first row's layout into columns.
+
+    Tabular responses repeat the same sub-dict layout on every row, so each
+    column can be pulled out with C-level `map`/`itemgetter` passes instead of
+    merging rows one at a time. Returns None when any row deviates from the
+    first row's layout, so the caller can fall back to the generic path.
+    """
+    first = rows[0]
+    width = len(first)
+    if set(map(len, rows)) != {width}:
+        return None
+
+    positions: Dict[str, int] = {}
+    n_keys = 0
+    for j, d in enumerate(first):
+        if set(map(len, map(itemgetter(j), rows))) != {len(d)}:
+            return None
+        n_keys += len(d)
+        for k in d:
+            positions[k] = j
+    if n_keys != len(positions):
+        # Keys repeated across sub-dicts; let the generic path merge them.
+        return None
+
+    try:
+        return {
+            k: list(map(itemgetter(k), map(itemgetter(j), rows)))
+            for k, j in positions.items()
+        }
+    except (KeyError, TypeError):
+        return None
+
+
+def _flatten_columnar(rows: Iterable[Sequence[Dict[str, Any]]]) -> Dict[str, List[Any]]:
+    """Flatten response rows straight into a column-major dict of lists.
+
+    Columns keep first-seen order; rows missing a key get `None` so every
+    column has one entry per row, matching what `pd.DataFrame(records)` does.
+    `rows` may be any iterable, e.g. a streaming parser.
+    """
+    if isinstance(rows, list) and rows:
+        fast = _columns_from_layout(rows)
+        if fast is not None:
+            return fast
+
+    columns: Dict[str, List[Any]] = {}
+    n = 0
+    for row in _flatten_stream(rows):
+        for k, v in row.items():
+            col = columns.get(k)
+            if col is None:
+                col = columns[k] = [None] * n
+            col.append(v)
+        n += 1
+        if len(columns) > len(row):
+            for col in columns.values():
+                if len(col) < n:
+                    col.append(None)
+    return columns
+
 class Unifier:
     """Client helpers to interact with the Unifier API.
 
@@ -27,6 +664,12 @@ class Unifier:
       passed per-call to the query helpers.
     - The `as_of` parameter is deprecated; prefer `asof_date` and
       `asof_back_to`.
+    - `timeout` (seconds, or None to wait forever) applies to the
+      synchronous HTTP helpers.
+    - As-of date lookups and the query results behind `get_dataframe`
+      and `get_json` are cached for `cache_ttl` seconds (0 disables); call
+      `invalidate_cache()` after rotating credentials or to force a
+      refresh. `query` returns the raw response and always hits the server.
     """
     
     url = 'https://unifier.x-tech.ai/unifier'
@@ -35,6 +678,74 @@ class Unifier:
 
     __version__ = '0.1.21'
 
+    # Shared HTTP session so repeated calls reuse pooled keep-alive connections
+    # instead of paying a TCP+TLS handshake per request.
+    _session: Optional[requests.Session] = None
+    _JSON_HEADERS = {
+        **_JSON_CONTENT_TYPE,
+        "Accept-Encoding": _accept_encoding(),
+    }
+    # Seconds to wait for the server to connect/send data on sync calls.
+    timeout: Optional[float] = 60
+    # Retries for transient connection errors and 429/5xx responses, on API
+    # calls and native S3 downloads. Read when the session is first created.
+    max_retries: int = 5
+    cache_ttl: float = 300
+    # Run rclone as a long-lived `rclone rcd` daemon shared by `replicate`
+    # calls; set to False to spawn a one-shot `rclone copy` per call.
+    use_rclone_daemon: bool = True
+    _rclone_daemon: Optional[_RcloneDaemon] = None
+    # Set once the daemon has failed to start; later calls use `rclone copy`.
+    _rclone_daemon_failed: bool = False
+    # Parallel ranged GETs per large file in the native downloader.
+    _MULTIPART_CONCURRENCY = 8
+    # Async HTTP/2 client used by `aquery`; bound to the loop that created it.
+    _aclient: Any = None
+    _aclient_loop: Any = None
+
+    @classmethod
+    def get_session(cls) -> requests.Session:
+        """Return the shared `requests.Session`, creating it on first use.
+
+        All synchronous API calls go through this session, so callers can
+        tune it (mount adapters, add headers or proxies) before querying.
+        """
+        if cls._session is None:
+            # Worker threads in query_many may get here together; build one session.
+            with _session_lock:
+                if cls._session is None:
+                    session = requests.Session()
+                    session.headers.update(cls._JSON_HEADERS)
+                    retries = Retry(
+                        total=cls.max_retries,
+                        backoff_factor=0.3,
+                        status_forcelist=(429, 502, 503, 504),
+                        # API calls are read-only, so POSTs are safe to retry; urllib3
+                        # skips them by default.
+                        allowed_methods=frozenset(["GET", "POST"]),
+                        # A read timeout means the server may still be running the
+                        # query; re-sending it would only multiply the load and wait.
+                        read=0,
+                        respect_retry_after_header=True,
+                        # Let the final error response through so callers log it as before.
+                        raise_on_status=False,
+                    )
+                    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=32, max_retries=retries)
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    cls._session = session
+        return cls._session
+
+    @classmethod
+    def _post(cls, url: str, payload: Dict[str, Any], **kwargs: Any) -> requests.Response:
+        """POST `payload` as JSON to `url` over the shared session."""
+        return cls.get_session().post(
+            url,
+            data=_dumps(payload),
+            timeout=cls.timeout,
+            **kwargs,
+        )
+
     @classmethod
     def get_asof_dates_query(cls, name: str) -> List[Dict[str, Any]]:
         """Get a list of available as-of dates for a given data `name`.
@@ -50,7 +761,21 @@ class Unifier:
             A flattened list of records with available as-of dates. Returns an
             empty list on error.
         """
-        headers = {"Content-Type": "application/json"}
+        return list(_flatten_stream(cls._fetch_asof_dates(name)))
+
+    @classmethod
+    def _fetch_asof_dates(cls, name: str) -> List[Sequence[Dict[str, Any]]]:
+        """Fetch the raw (unflattened) as-of date rows for `name`.
+
+        Successful non-empty results are cached for `cache_ttl` seconds.
+        Returns an empty list on error.
+        """
+        cache_key = (cls.url, cls.user, cls.token, name)
+        if cls.cache_ttl > 0:
+            cached = _asof_dates_cache.get(cache_key, cls.cache_ttl)
+            if cached is not None:
+                return cached
+
         payload = {
             "name": name,
             "user": cls.user,
@@ -58,41 +783,38 @@ class Unifier:
         }
 
         _url = cls.url + "/get_asof_date"
-        try:
-            response = requests.post(_url, headers=headers, json=payload)
-            if response.status_code != 200:
-                # Try to surface server-provided error, otherwise log status code.
-                try:
-                    err = response.json()
-                except ValueError:
-                    err = {}
-                if isinstance(err, dict) and "error" in err:
-                    logger.warning("Unifier as-of dates error: %s", err["error"])
-                    return []
-
-                logger.warning(
-                    "Unifier as-of dates request failed with status code %s",
-                    response.status_code,
-                )
-                return []
+        response_data = cls._stream_query(_url, payload, list, "as-of dates")
+        if response_data and cls.cache_ttl > 0:
+            _asof_dates_cache.set(cache_key, response_data)
+        return response_data
 
-            response_data = response.json()
-            if not isinstance(response_data, list):
-                logger.warning("Unexpected as-of dates response format: %r", type(response_data))
-                return []
-            extracted_data = [
-                {k: v for d in item for k, v in d.items()} for item in response_data
-            ]
-            return extracted_data
-        except requests.exceptions.RequestException as e:
-            logger.error("As-of dates request failed: %s", e)
-            return []
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        """Drop all cached API results so the next calls hit the server."""
+        _asof_dates_cache.clear()
+        _query_cache.clear()
 
     @classmethod
-    def get_asof_dates(cls, name: str) -> pd.DataFrame:
-        """Get a pandas DataFrame of available as-of dates for a given name."""
-        _data = cls.get_asof_dates_query(name)
-        return pd.DataFrame(_data)
+    def get_asof_dates(
+        cls,
+        name: str,
+        schema: Optional[Dict[str, Any]] = None,
+        backend: str = "numpy",
+    ) -> "pd.DataFrame":
+        """Get a pandas DataFrame of available as-of dates for a given name.
+
+        `schema` optionally maps column names to dtypes, e.g.
+        `{"asof_date": "datetime64[ns]"}`, to build those columns directly
+        with that type instead of letting pandas infer them. `backend` is as
+        in `get_dataframe`.
+        """
+        _data = cls._fetch_asof_dates(name)
+        if not _data:
+            return _to_dataframe({})
+        data = _flatten_columnar(_data)
+        if schema:
+            data = _apply_schema(data, schema)
+        return _to_dataframe(data, backend)
 
     @classmethod
     def get_asof_dates_json(cls, name: str) -> List[Dict[str, Any]]:
@@ -108,7 +830,6 @@ class Unifier:
         list[dict]
             A list of dataset metadata objects. Returns an empty list on error.
         """
-        headers = {"Content-Type": "application/json"}
         payload = {
             "user": cls.user,
             "token": cls.token,
@@ -116,22 +837,22 @@ class Unifier:
 
         _url = cls.url + "/list-data-catalogs"
         try:
-            response = requests.post(_url, headers=headers, json=payload)
+            response = cls._post(_url, payload)
             if response.status_code != 200:
-                try:
-                    err = response.json()
-                except ValueError:
-                    err = {}
-                if isinstance(err, dict) and "error" in err:
-                    logger.warning("Unifier list-data-catalog error: %s", err["error"])
+                err = _error_from_response(response)
+                if err is not None:
+                    logger.warning("Unifier list-data-catalog error: %s", err)
                 else:
                     logger.warning("Unifier list-data-catalog failed with status code %s", response.status_code)
                 return []
 
-            return response.json()
+            return _loads(response.content)
         except requests.exceptions.RequestException as e:
             logger.error("Unifier list-data-catalog request failed: %s", e)
             return []
+        except ValueError as e:
+            logger.error("Unifier list-data-catalog response could not be parsed: %s", e)
+            return []
 
     @classmethod
     def get_dataset_details(cls, name: str) -> Dict[str, Any]:
@@ -147,7 +868,6 @@ class Unifier:
         dict
             The dataset metadata object. Returns an empty dict on error.
         """
-        headers = {"Content-Type": "application/json"}
         payload = {
             "name": name,
             "user": cls.user,
@@ -156,22 +876,22 @@ class Unifier:
 
         _url = cls.url + "/data-catalog"
         try:
-            response = requests.post(_url, headers=headers, json=payload)
+            response = cls._post(_url, payload)
             if response.status_code != 200:
-                try:
-                    err = response.json()
-                except ValueError:
-                    err = {}
-                if isinstance(err, dict) and "error" in err:
-                    logger.warning("Unifier get-dataset-details error: %s", err["error"])
+                err = _error_from_response(response)
+                if err is not None:
+                    logger.warning("Unifier get-dataset-details error: %s", err)
                 else:
                     logger.warning("Unifier get-dataset-details failed with status code %s", response.status_code)
                 return {}
 
-            return response.json()
+            return _loads(response.content)
         except requests.exceptions.RequestException as e:
             logger.error("Unifier get-dataset-details request failed: %s", e)
             return {}
+        except ValueError as e:
+            logger.error("Unifier get-dataset-details response could not be parsed: %s", e)
+            return {}
 
     @classmethod
     def query(
@@ -189,6 +909,7 @@ class Unifier:
         limit: Optional[int] = None,
         column_filters: Optional[str] = None,
         disable_view: bool = False,
+        columns: Optional[Sequence[str]] = None,
     ) -> List[Sequence[Dict[str, Any]]]:
         """Query the Unifier API and return the raw response data as-is.
 
@@ -212,6 +933,10 @@ class Unifier:
             SQL-compatible boolean expression to filter columns/rows server-side.
         disable_view : bool
             If true, disable view expansion on the server.
+        columns : Optional[Sequence[str]]
+            Only return these columns. Sent as the `columns` payload field;
+            `get_dataframe` and `get_json` also filter client-side in case
+            the server does not apply it.
 
         Returns
         -------
@@ -220,64 +945,248 @@ class Unifier:
             dicts). Returns an empty list on error.
         """
 
-        headers = {"Content-Type": "application/json"}
-        payload: Dict[str, Any] = {
-            "name": name,
-            "user": cls.user,
-            "token": cls.token,
-            "disable_view": disable_view,
-        }
+        payload = cls._build_query_payload(
+            name,
+            user=user,
+            token=token,
+            key=key,
+            keys=keys,
+            as_of=as_of,
+            back_to=back_to,
+            up_to=up_to,
+            asof_date=asof_date,
+            asof_back_to=asof_back_to,
+            limit=limit,
+            column_filters=column_filters,
+            disable_view=disable_view,
+            columns=columns,
+        )
 
-        if limit is not None:
-            payload["limit"] = limit
+        return cls._run_query(payload)
 
-        if key is not None:
-            payload["key"] = key
-        if keys is not None:
-            payload["keys"] = list(keys)
-        if token is not None:
-            payload["token"] = token
-        if user is not None:
-            payload["user"] = user
-        if column_filters is not None:
-            payload["column_filters"] = column_filters
-
-        # `as_of` is deprecated; map to `asof_date` for backward compatibility.
-        if as_of is not None:
-            payload["asof_date"] = as_of
-        if asof_back_to is not None:
-            payload["asof_back_to"] = asof_back_to
-        if back_to is not None:
-            payload["back_to"] = back_to
-        if up_to is not None:
-            payload["up_to"] = up_to
-        if asof_date is not None:
-            payload["asof_date"] = asof_date
+    @classmethod
+    def query_many(
+        cls,
+        name: str,
+        keys: Sequence[str],
+        chunk_size: int = 500,
+        max_workers: int = 8,
+        **kwargs: Any,
+    ) -> List[Sequence[Dict[str, Any]]]:
+        """Query many `keys` in parallel, `chunk_size` keys per request.
 
+        Chunks are sent concurrently over the shared session and the raw rows
+        are concatenated in chunk order. Other keyword arguments are passed to
+        `query`. Chunks that fail are logged and contribute no rows.
+        """
+        chunks = _chunked(keys, chunk_size)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(lambda chunk: cls.query(name, keys=chunk, **kwargs), chunks)
+            return [row for result in results for row in result]
+
+    @classmethod
+    def get_dataframe_many(
+        cls,
+        name: str,
+        keys: Sequence[str],
+        chunk_size: int = 500,
+        max_workers: int = 8,
+        backend: str = "numpy",
+        **kwargs: Any,
+    ) -> "pd.DataFrame":
+        """DataFrame variant of `query_many`; see `get_dataframe` for options."""
+        import pandas as pd
+
+        columns = kwargs.get("columns")
+        payloads = [
+            cls._build_query_payload(name, keys=chunk, **kwargs)
+            for chunk in _chunked(keys, chunk_size)
+        ]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(cls._query_columns, payloads))
+        frames = [
+            _to_dataframe(_select_columns(data, columns), backend) for data in results if data
+        ]
+        if not frames:
+            return _to_dataframe({})
+        return pd.concat(frames, ignore_index=True)
+
+    @classmethod
+    def _run_query(cls, payload: Dict[str, Any]) -> List[Sequence[Dict[str, Any]]]:
+        """POST a query payload and return the raw rows, or [] on error."""
+        return cls._stream_query(cls.url, payload, list)
+
+    @classmethod
+    def _stream_query(
+        cls,
+        url: str,
+        payload: Dict[str, Any],
+        consume: Callable[[Iterable[Any]], Any],
+        what: str = "query",
+    ) -> Any:
+        """POST `payload` and feed the response rows to `consume`.
+
+        When `ijson` is installed the body is parsed incrementally while it
+        downloads, so neither the raw body nor (depending on `consume`) the
+        full response tree is ever held in memory. Without it the body is
+        parsed in one go. On any error, logs and returns `consume([])`.
+        """
         try:
-            response = requests.post(cls.url, headers=headers, json=payload)
-            if response.status_code != 200:
-                try:
-                    err = response.json()
-                except ValueError:
-                    err = {}
-                if isinstance(err, dict) and "error" in err:
-                    logger.warning("Unifier query error: %s", err["error"])
-                    return []
-
-                logger.warning(
-                    "Unifier query failed with status code %s", response.status_code
-                )
-                return []
-            response_data = response.json()
-            if not isinstance(response_data, list):
-                logger.warning("Unexpected query response format: %r", type(response_data))
+            if ijson is None:
+                response = cls._post(url, payload)
+                return consume(cls._parse_query_response(response, what))
+            with cls._post(url, payload, stream=True) as response:
+                if response.status_code != 200:
+                    return consume(cls._parse_query_response(response, what))
+                # Let urllib3 undo any Content-Encoding while ijson reads.
+                response.raw.decode_content = True
+                head = _read_json_head(response.raw)
+                if not head.lstrip().startswith(b"["):
+                    # Not a row list (e.g. an error object); parse it whole so
+                    # it is reported like on the non-streaming path.
+                    return consume(_rows_from_body(head + response.raw.read(), what))
+                stream = _ReplayStream(head, response.raw)
+                return consume(ijson.items(stream, "item", use_float=True))
+        except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError) as e:
+            logger.error("Unifier %s request failed: %s", what, e)
+        except _IJSON_ERRORS as e:
+            logger.error("Unifier %s response could not be parsed: %s", what, e)
+        return consume([])
+
+    @classmethod
+    def _build_query_payload(
+        cls,
+        name: str,
+        user: Optional[str] = None,
+        token: Optional[str] = None,
+        key: Optional[str] = None,
+        keys: Optional[Sequence[str]] = None,
+        as_of: Optional[str] = None,
+        back_to: Optional[str] = None,
+        up_to: Optional[str] = None,
+        asof_date: Optional[str] = None,
+        asof_back_to: Optional[str] = None,
+        limit: Optional[int] = None,
+        column_filters: Optional[str] = None,
+        disable_view: bool = False,
+        columns: Optional[Sequence[str]] = None,
+    ) -> Dict[str, Any]:
+        """Build the JSON payload sent by `query` and `aquery`.
+
+        Optional fields left as None are omitted; `user`/`token` default to
+        the class-level credentials.
+        """
+        if keys is not None:
+            keys = _as_list(keys)
+        params = (
+            ("name", name),
+            ("user", cls.user if user is None else user),
+            ("token", cls.token if token is None else token),
+            ("disable_view", disable_view),
+            ("limit", limit),
+            ("key", key),
+            ("keys", keys),
+            ("column_filters", column_filters),
+            # `as_of` is deprecated; map to `asof_date` for backward compatibility.
+            ("asof_date", asof_date if asof_date is not None else as_of),
+            ("asof_back_to", asof_back_to),
+            ("back_to", back_to),
+            ("up_to", up_to),
+            ("columns", list(columns) if columns is not None else None),
+        )
+        return {k: v for k, v in params if v is not None}
+
+    @staticmethod
+    def _parse_query_response(response: Any, what: str = "query") -> List[Any]:
+        """Extract the row list from a `requests` or `httpx` response.
+
+        Returns an empty list (after logging) on error status, a body that
+        is not JSON, or unexpected payload shape.
+        """
+        if response.status_code != 200:
+            err = _error_from_response(response)
+            if err is not None:
+                logger.warning("Unifier %s error: %s", what, err)
                 return []
-            return response_data
-        except requests.exceptions.RequestException as e:
-            logger.error("Unifier query request failed: %s", e)
+
+            logger.warning(
+                "Unifier %s failed with status code %s", what, response.status_code
+            )
+            return []
+        return _rows_from_body(response.content, what)
+
+    @classmethod
+    async def _get_async_client(cls) -> Any:
+        """Return the shared `httpx.AsyncClient` for the running event loop.
+
+        The client is rebuilt (and the previous one closed) when called from
+        a different event loop, since pooled connections cannot be shared
+        across loops. Requests honour `timeout` like the sync helpers. httpx
+        advertises every response encoding it can decode (gzip, plus br/zstd
+        when the `compression` extra is installed), so no Accept-Encoding is
+        set here.
+        """
+        loop = asyncio.get_running_loop()
+        if cls._aclient is None or cls._aclient_loop is not loop:
+            stale = cls._aclient
+            cls._aclient = httpx.AsyncClient(
+                http2=True,
+                headers=_JSON_CONTENT_TYPE,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                timeout=cls.timeout,
+            )
+            cls._aclient_loop = loop
+            if stale is not None:
+                try:
+                    await stale.aclose()
+                except Exception as e:
+                    # Its connections may belong to a loop that is already closed.
+                    logger.debug("Could not close previous async client cleanly: %s", e)
+        return cls._aclient
+
+    @classmethod
+    async def aquery(cls, name: str, **kwargs: Any) -> List[Sequence[Dict[str, Any]]]:
+        """Asynchronous variant of `query` using an HTTP/2 `httpx` client.
+
+        Accepts the same keyword arguments as `query`. Concurrent calls share
+        one multiplexed connection to the Unifier host. Requires the optional
+        `httpx[http2]` dependency; the synchronous helpers keep using the
+        shared `requests.Session`.
+        """
+        if httpx is None or h2 is None:
+            logger.error("httpx[http2] is not installed. Cannot use the async query helpers.")
+            logger.info("Please install httpx: pip install 'httpx[http2]'")
+            return []
+
+        payload = cls._build_query_payload(name, **kwargs)
+        try:
+            # Serialized with `_dumps` (orjson when available), like `_post`.
+            client = await cls._get_async_client()
+            response = await client.post(cls.url, content=_dumps(payload))
+            return cls._parse_query_response(response)
+        except httpx.HTTPError as e:
+            # httpx timeouts carry no message; fall back to the exception type.
+            logger.error("Unifier async query request failed: %s", str(e) or type(e).__name__)
             return []
 
+    @classmethod
+    async def agather(
+        cls, names: Sequence[str], **kwargs: Any
+    ) -> List[List[Sequence[Dict[str, Any]]]]:
+        """Run `aquery` concurrently for several `names`, preserving order."""
+        return await asyncio.gather(*[cls.aquery(n, **kwargs) for n in names])
+
+    @classmethod
+    async def aget_dataframe(
+        cls, name: str, backend: str = "numpy", **kwargs: Any
+    ) -> "pd.DataFrame":
+        """Asynchronous variant of `get_dataframe`."""
+        json_result = await cls.aquery(name, **kwargs)
+        if not json_result:
+            return _to_dataframe({})
+        data = _select_columns(_flatten_columnar(json_result), kwargs.get("columns"))
+        return _to_dataframe(data, backend)
+
     @classmethod
     def get_dataframe(
         cls,
@@ -294,34 +1203,56 @@ class Unifier:
         limit: Optional[int] = None,
         column_filters: Optional[str] = None,
         disable_view: bool = False,
-    ) -> pd.DataFrame:
+        columns: Optional[Sequence[str]] = None,
+        backend: str = "numpy",
+    ) -> "pd.DataFrame":
         """Get the query result as a pandas DataFrame.
 
+        `backend="pyarrow"` returns Arrow-backed columns (`pd.ArrowDtype`)
+        instead of NumPy/object dtypes, which is much lighter for string-heavy
+        results; it needs the optional `pyarrow` package.
+
         Returns an empty DataFrame on error or empty result.
         """
-
-        json_result = cls.query(
+        payload = cls._build_query_payload(
             name,
-            user,
-            token,
-            key,
-            keys,
-            as_of,
-            back_to,
-            up_to,
-            asof_date,
-            asof_back_to,
-            limit,
-            column_filters,
-            disable_view,
+            user=user,
+            token=token,
+            key=key,
+            keys=keys,
+            as_of=as_of,
+            back_to=back_to,
+            up_to=up_to,
+            asof_date=asof_date,
+            asof_back_to=asof_back_to,
+            limit=limit,
+            column_filters=column_filters,
+            disable_view=disable_view,
+            columns=columns,
         )
-        if not json_result:
-            return pd.DataFrame()
-        extracted_data = [
-            {k: v for d in item for k, v in d.items()} for item in json_result
-        ]
-        return pd.DataFrame(extracted_data)
-    
+        data = _select_columns(cls._query_columns(payload), columns)
+        return _to_dataframe(data, backend)
+
+    @classmethod
+    def _query_columns(cls, payload: Dict[str, Any]) -> Dict[str, List[Any]]:
+        """Run a query and flatten the response straight into columns.
+
+        Successful non-empty results of up to a million cells are cached for
+        `cache_ttl` seconds, keyed on the exact payload. The result may be
+        the cached object itself, so callers must not modify it. Returns an
+        empty dict on error.
+        """
+        cache_key = (cls.url, _dumps(payload))
+        if cls.cache_ttl > 0:
+            cached = _query_cache.get(cache_key, cls.cache_ttl)
+            if cached is not None:
+                return cached
+
+        data = cls._stream_query(cls.url, payload, _flatten_columnar)
+        if data and cls.cache_ttl > 0:
+            _query_cache.set(cache_key, data, weight=sum(map(len, data.values())))
+        return data
+
     @classmethod
     def get_json(
         cls,
@@ -338,33 +1269,58 @@ class Unifier:
         limit: Optional[int] = None,
         column_filters: Optional[str] = None,
         disable_view: bool = False,
-    ) -> List[Dict[str, Any]]:
+        columns: Optional[Sequence[str]] = None,
+        orient: str = "records",
+    ) -> Union[List[Dict[str, Any]], Dict[str, List[Any]]]:
         """Get the query result as a flattened JSON list of dicts.
 
-        Returns an empty list on error or empty result.
+        With `orient="columns"` the result is instead a dict mapping each
+        column name to its list of values, built directly from the response
+        without creating a dict per row.
+
+        While caching is on, records are rebuilt from the cached columns, so
+        every record has every column (None where the row had no value).
+
+        Returns an empty list (or dict) on error or empty result.
         """
+        if orient not in ("records", "columns"):
+            raise ValueError(f"Unknown orient: {orient!r}")
 
-        json_result = cls.query(
+        payload = cls._build_query_payload(
             name,
-            user,
-            token,
-            key,
-            keys,
-            as_of,
-            back_to,
-            up_to,
-            asof_date,
-            asof_back_to,
-            limit,
-            column_filters,
-            disable_view,
+            user=user,
+            token=token,
+            key=key,
+            keys=keys,
+            as_of=as_of,
+            back_to=back_to,
+            up_to=up_to,
+            asof_date=asof_date,
+            asof_back_to=asof_back_to,
+            limit=limit,
+            column_filters=column_filters,
+            disable_view=disable_view,
+            columns=columns,
         )
-        if not json_result:
-            return []
-        extracted_data = [
-            {k: v for d in item for k, v in d.items()} for item in json_result
-        ]
-        return extracted_data
+        if orient == "columns":
+            data = _select_columns(cls._query_columns(payload), columns)
+            if cls.cache_ttl > 0:
+                # Hand out lists the caller may modify without touching the cache.
+                data = {k: list(v) for k, v in data.items()}
+            return data
+        if cls.cache_ttl > 0:
+            # Share the cache with get_dataframe so both see the same result.
+            data = _select_columns(cls._query_columns(payload), columns)
+            names = list(data)
+            return [dict(zip(names, values)) for values in zip(*data.values())]
+
+        def _records(rows: Iterable[Any]) -> List[Dict[str, Any]]:
+            records = _flatten_stream(rows)
+            if columns is None:
+                return list(records)
+            return [{k: row[k] for k in columns if k in row} for row in records]
+
+        return cls._stream_query(cls.url, payload, _records)
 
     @classmethod
     def replicate(
@@ -376,6 +1332,11 @@ class Unifier:
         up_to: Optional[str] = None,
         bandwidth_limit: Optional[int] = None,
         use_rclone: bool = True,
+        use_s5cmd: bool = True,
+        transfers: int = 16,
+        checkers: int = 32,
+        multipart_threshold: int = 25 * 1024 * 1024,
+        multipart_chunksize: int = 16 * 1024 * 1024,
     ) -> None:
         """Replicate data to a local target location using rclone or native python.
 
@@ -396,8 +1357,21 @@ class Unifier:
         use_rclone : bool
             If True, attempt to use rclone. Falls back to native Python implementation
             if rclone is not available.
+        use_s5cmd : bool
+            If True and rclone is not used, download with `s5cmd` when it is on
+            PATH before falling back to native Python.
+        transfers : int
+            Number of files downloaded in parallel.
+        checkers : int
+            Number of parallel rclone checkers comparing source and target
+            (rclone only).
+        multipart_threshold : int
+            Size in bytes above which a file is downloaded in parallel parts
+            (native Python only).
+        multipart_chunksize : int
+            Size in bytes of each part (native Python, and `--part-size` for
+            s5cmd).
         """
-        headers = {"Content-Type": "application/json"}
         payload = {
             "name": name,
             "user": cls.user,
@@ -411,26 +1385,21 @@ class Unifier:
         if up_to:
             payload["up_to"] = up_to
 
-        # Check for rclone availability
-        rclone_path = shutil.which("rclone")
-        using_rclone = use_rclone and (rclone_path is not None)
+        using_rclone = use_rclone and (_RCLONE_PATH is not None)
 
         _url = cls.url + "/replicate"
 
         try:
             # Fetch replication credentials
-            response = requests.post(_url, headers=headers, json=payload)
+            response = cls._post(_url, payload)
             if response.status_code != 200:
-                try:
-                    err_msg = response.json().get("error", "Unknown error")
-                except ValueError:
-                    err_msg = response.text
+                err_msg = _error_from_response(response) or response.text or "Unknown error"
                 err_msg = f"Unifier replicate error: {err_msg}"
                 logger.warning(err_msg)
                 print(err_msg)
                 return
 
-            resp_json = response.json()
+            resp_json = _loads(response.content)
 
             data = resp_json.get("data")
             if not data:
@@ -459,36 +1428,78 @@ class Unifier:
                 data_path = data_path[6:]
 
             if using_rclone:
-                # Prepare rclone environment
-                env = os.environ.copy()
-                env["RCLONE_CONFIG_UNIFIER_TYPE"] = "s3"
-                env["RCLONE_CONFIG_UNIFIER_PROVIDER"] = "Wasabi"
-                env["RCLONE_CONFIG_UNIFIER_ENV_AUTH"] = "false"
-                env["RCLONE_CONFIG_UNIFIER_ACCESS_KEY_ID"] = access_key_id
-                env["RCLONE_CONFIG_UNIFIER_SECRET_ACCESS_KEY"] = secret_access_key
-                env["RCLONE_CONFIG_UNIFIER_ENDPOINT"] = endpoint
-                env["RCLONE_CONFIG_UNIFIER_REGION"] = region
-
-                source = f"UNIFIER:{data_path}"
-                if not source.endswith("/"):
-                    source += "/"
-
-                # Construct command
-                cmd = ["rclone", "copy", source, target_location, "--progress", "--config", "/dev/null"]
-
-                if bandwidth_limit:
-                     cmd.extend(["--bwlimit", f"{bandwidth_limit}M"])
-
-                for folder in folders:
-                    if folder.startswith("/"):
-                        folder = folder.lstrip("/")
-                    if folder.endswith("*"):
-                        folder = folder[:-1] + "**"
-                    cmd.extend(["--include", folder])
-
+                include = _rclone_include_patterns(folders)
+                daemon = cls._get_rclone_daemon(_RCLONE_PATH) if cls.use_rclone_daemon else None
                 print(f"Downloading with rclone for {name}...")
-                subprocess.run(cmd, env=env, check=True)
+                if daemon is not None:
+                    daemon.copy(
+                        parameters={
+                            "provider": "Wasabi",
+                            "env_auth": "false",
+                            "access_key_id": access_key_id,
+                            "secret_access_key": secret_access_key,
+                            "endpoint": endpoint,
+                            "region": region,
+                        },
+                        data_path=data_path,
+                        target_location=target_location,
+                        include=include,
+                        transfers=transfers,
+                        checkers=checkers,
+                        bandwidth_limit=bandwidth_limit,
+                    )
+                else:
+                    # Prepare rclone environment
+                    env = os.environ.copy()
+                    env["RCLONE_CONFIG_UNIFIER_TYPE"] = "s3"
+                    env["RCLONE_CONFIG_UNIFIER_PROVIDER"] = "Wasabi"
+                    env["RCLONE_CONFIG_UNIFIER_ENV_AUTH"] = "false"
+                    env["RCLONE_CONFIG_UNIFIER_ACCESS_KEY_ID"] = access_key_id
+                    env["RCLONE_CONFIG_UNIFIER_SECRET_ACCESS_KEY"] = secret_access_key
+                    env["RCLONE_CONFIG_UNIFIER_ENDPOINT"] = endpoint
+                    env["RCLONE_CONFIG_UNIFIER_REGION"] = region
+
+                    source = f"UNIFIER:{data_path}"
+                    if not source.endswith("/"):
+                        source += "/"
+
+                    # Construct command
+                    cmd = [
+                        _RCLONE_PATH, "copy", source, target_location,
+                        # One stats line every 10s; --progress redraws the
+                        # terminal, which does not work through a pipe.
+                        "--stats", "10s",
+                        "--stats-one-line",
+                        "--stats-log-level", "NOTICE",
+                        "--config", "/dev/null",
+                        "--transfers", str(transfers),
+                        "--checkers", str(checkers),
+                        # One recursive listing instead of one request per directory.
+                        "--fast-list",
+                        "--use-mmap",
+                    ]
+
+                    if bandwidth_limit:
+                        cmd.extend(["--bwlimit", f"{bandwidth_limit}M"])
+
+                    for pattern in include:
+                        cmd.extend(["--include", pattern])
+
+                    _run_streaming(cmd, env)
                 print(f"Replication completed for {name}")
+            elif use_s5cmd and _S5CMD_PATH is not None:
+                cls._replicate_s5cmd(
+                    access_key_id=access_key_id,
+                    secret_access_key=secret_access_key,
+                    endpoint=endpoint,
+                    region=region,
+                    data_path=data_path,
+                    target_location=target_location,
+                    folders=folders,
+                    name=name,
+                    max_workers=transfers,
+                    multipart_chunksize=multipart_chunksize,
+                )
             else:
                 cls._replicate_native(
                     access_key_id=access_key_id,
@@ -498,14 +1509,17 @@ class Unifier:
                     data_path=data_path,
                     target_location=target_location,
                     folders=folders,
-                    name=name
+                    name=name,
+                    max_workers=transfers,
+                    multipart_threshold=multipart_threshold,
+                    multipart_chunksize=multipart_chunksize,
                 )
 
         except requests.exceptions.RequestException as e:
             err_msg = f"Replicate network request failed: {e}"
             logger.error(err_msg)
             print(err_msg)
-        except subprocess.CalledProcessError as e:
+        except (subprocess.CalledProcessError, RuntimeError) as e:
             err_msg = f"Rclone execution failed: {e}"
             logger.error(err_msg)
             print(err_msg)
@@ -514,6 +1528,82 @@ class Unifier:
             logger.error(err_msg)
             print(err_msg)
 
+    @classmethod
+    def _get_rclone_daemon(cls, rclone_path: str) -> Optional[_RcloneDaemon]:
+        """Return the shared rclone daemon, starting it on first use.
+
+        Returns None (after logging) if the daemon cannot be started, so the
+        caller can fall back to a one-shot `rclone copy`. A failed start is
+        not retried for the rest of the process.
+        """
+        with _rclone_daemon_lock:
+            if cls._rclone_daemon_failed:
+                return None
+            if cls._rclone_daemon is None or not cls._rclone_daemon.alive():
+                try:
+                    cls._rclone_daemon = _RcloneDaemon(rclone_path)
+                except (OSError, RuntimeError, requests.exceptions.RequestException) as e:
+                    logger.warning("Could not start rclone daemon, using rclone copy: %s", e)
+                    cls._rclone_daemon = None
+                    cls._rclone_daemon_failed = True
+                    return None
+            return cls._rclone_daemon
+
+    @classmethod
+    def _replicate_s5cmd(
+        cls,
+        access_key_id: str,
+        secret_access_key: str,
+        endpoint: str,
+        region: str,
+        data_path: str,
+        target_location: str,
+        folders: List[str],
+        name: str,
+        max_workers: int = 16,
+        multipart_chunksize: int = 16 * 1024 * 1024,
+    ) -> None:
+        """Replication using the `s5cmd` binary.
+
+        s5cmd schedules its transfers in Go, without the per-object Python
+        overhead of boto3, so it is preferred when rclone is unavailable.
+        Folder globs are passed as `--include` rules, which s5cmd matches
+        against the path below the prefix like the native implementation.
+        """
+        env = os.environ.copy()
+        # Only the replication credentials may be used, not the caller's profile.
+        for var in ("AWS_PROFILE", "AWS_SESSION_TOKEN"):
+            env.pop(var, None)
+        env["AWS_ACCESS_KEY_ID"] = access_key_id
+        env["AWS_SECRET_ACCESS_KEY"] = secret_access_key
+        env["AWS_REGION"] = region
+
+        source = f"s3://{data_path}"
+        if not source.endswith("/"):
+            source += "/"
+
+        cmd = [
+            _S5CMD_PATH,
+            "--endpoint-url", endpoint,
+            "--numworkers", str(max_workers),
+            "cp",
+            "--concurrency", str(cls._MULTIPART_CONCURRENCY),
+            "--part-size", str(max(multipart_chunksize // (1024 * 1024), 5)),
+        ]
+        for folder in folders:
+            cmd.extend(["--include", folder.lstrip("/")])
+        cmd.extend([source + "*", os.path.join(target_location, "")])
+
+        print(f"Downloading with s5cmd for {name}...")
+        try:
+            _run_streaming(cmd, env)
+        except subprocess.CalledProcessError as e:
+            err_msg = f"s5cmd execution failed: {e}"
+            logger.error(err_msg)
+            print(err_msg)
+            return
+        print(f"Replication completed for {name}")
+
     @classmethod
     def _replicate_native(
         cls,
@@ -524,9 +1614,18 @@ class Unifier:
         data_path: str,
         target_location: str,
         folders: List[str],
-        name: str
+        name: str,
+        max_workers: int = 16,
+        multipart_threshold: int = 25 * 1024 * 1024,
+        multipart_chunksize: int = 16 * 1024 * 1024,
     ) -> None:
-        """Replication using native Python (boto3)."""
+        """Replication using native Python (boto3).
+
+        Downloads start while the bucket is still being listed; at most
+        `2 * max_workers` downloads are queued at once. Files at or above
+        `multipart_threshold` bytes are fetched as parallel ranged GETs of
+        `multipart_chunksize` bytes, up to `_MULTIPART_CONCURRENCY` per file.
+        """
         if boto3 is None:
             logger.error("boto3 is not installed. Cannot use native Python implementation.")
             logger.info("Please install boto3: pip install boto3")
@@ -537,7 +1636,14 @@ class Unifier:
         # default. Wasabi (and other S3-compatible stores) reject these on
         # multipart/ranged GETs, returning SignatureDoesNotMatch. Disable them
         # when the running botocore supports the options.
-        config_kwargs = {'signature_version': 's3v4'}
+        config_kwargs = {
+            'signature_version': 's3v4',
+            # Enough pooled connections for every file's parallel parts.
+            'max_pool_connections': max_workers * cls._MULTIPART_CONCURRENCY,
+            # Back off on throttling and 5xx instead of failing the whole
+            # replication; max_attempts includes the first try.
+            'retries': {'max_attempts': cls.max_retries + 1, 'mode': 'adaptive'},
+        }
         try:
             s3_config = Config(
                 request_checksum_calculation='when_required',
@@ -567,59 +1673,92 @@ class Unifier:
             if f.startswith("/"):
                 f = f.lstrip("/")
             match_patterns.append(f)
+        matcher = _compile_globs(match_patterns)
 
         print(f"Downloading using native python implementation for {name}...")
 
+        # Files below the multipart threshold use a single GET; with the
+        # defaults up to max_workers * 8 parts are in flight at once.
+        transfer_config = TransferConfig(
+            multipart_threshold=multipart_threshold,
+            multipart_chunksize=multipart_chunksize,
+            max_concurrency=cls._MULTIPART_CONCURRENCY,
+            io_chunksize=1024 * 1024,
+            use_threads=True,
+        )
+
+        def _download_one(args):
+            b_name, k, l_file = args
+            # s3 client is thread-safe.
+            s3.download_file(b_name, k, l_file, Config=transfer_config)
+
+        # Progress and the first failure are tracked from completion
+        # callbacks, so finished futures are not kept around for
+        # million-object prefixes.
+        lock = threading.Lock()
+        in_flight = threading.BoundedSemaphore(max_workers * 2)
+        state = {"completed": 0, "error": None}
+
+        def _on_done(future):
+            in_flight.release()
+            error = future.exception()
+            with lock:
+                if error is not None:
+                    if state["error"] is None:
+                        state["error"] = error
+                    return
+                state["completed"] += 1
+                completed = state["completed"]
+            if completed % 10 == 0:
+                print(f"Downloaded {completed} files...")
+
         try:
             paginator = s3.get_paginator('list_objects_v2')
-            pages = paginator.paginate(Bucket=bucket_name, Prefix=prefix)
-            
-            download_tasks = []
-            for page in pages:
-                if 'Contents' not in page:
-                    continue
-                for obj in page['Contents']:
-                    key = obj['Key']
-                    
-                    # Calculate relative path
-                    if not key.startswith(prefix):
-                         continue
-                    rel_path = key[len(prefix):]
-                    if not rel_path:
-                        continue 
-
-                    # Filter
-                    if match_patterns:
-                        if not any(fnmatch.fnmatch(rel_path, p) for p in match_patterns):
+            # Fetch the next listing page while this one is being dispatched.
+            listing = _prefetch(paginator.paginate(Bucket=bucket_name, Prefix=prefix))
+
+            total_files = 0
+            # Each target directory is created once, here, rather than by
+            # every download task.
+            created_dirs = set()
+            with closing(listing) as pages, ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for page in pages:
+                    if 'Contents' not in page:
+                        continue
+                    for obj in page['Contents']:
+                        key = obj['Key']
+
+                        # Calculate relative path
+                        if not key.startswith(prefix):
                             continue
-                    
-                    local_file = os.path.join(target_location, rel_path)
-                    download_tasks.append((bucket_name, key, local_file))
-            
-            total_files = len(download_tasks)
+                        rel_path = key[len(prefix):]
+                        if not rel_path:
+                            continue
+
+                        # Filter
+                        if matcher is not None and matcher.match(rel_path) is None:
+                            continue
+
+                        if state["error"] is not None:
+                            break
+                        local_file = os.path.join(target_location, rel_path)
+                        local_dir = os.path.dirname(local_file)
+                        if local_dir not in created_dirs:
+                            os.makedirs(local_dir, exist_ok=True)
+                            created_dirs.add(local_dir)
+                        in_flight.acquire()
+                        future = executor.submit(_download_one, (bucket_name, key, local_file))
+                        future.add_done_callback(_on_done)
+                        total_files += 1
+                    if state["error"] is not None:
+                        break
+
+            if state["error"] is not None:
+                raise state["error"]
             if total_files == 0:
                 print(f"No files found to replicate for {name}")
                 return
 
-            print(f"Found {total_files} files to download.")
-
-            def _download_one(args):
-                b_name, k, l_file = args
-                local_dir = os.path.dirname(l_file)
-                os.makedirs(local_dir, exist_ok=True)
-                # s3 client is thread-safe. Use boto3's default TransferConfig
-                # (8 MB multipart threshold) so small files use a single GET.
-                s3.download_file(b_name, k, l_file)
-
-            # Use ThreadPoolExecutor for parallel file downloads
-            completed_count = 0
-            with ThreadPoolExecutor(max_workers=10) as executor:
-                # We use list() to consume the iterator and wait for all tasks to complete
-                for _ in executor.map(_download_one, download_tasks):
-                    completed_count += 1
-                    if completed_count % 10 == 0:
-                        print(f"Downloaded {completed_count}/{total_files} files...")
-            
             print(f"Native replication completed for {name}. Downloaded {total_files} files.")
         except Exception as e:
             err_msg = f"Native replication failed: {e}"